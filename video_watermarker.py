@@ -5,38 +5,138 @@ Adds a centered two-line text watermark with configurable coverage and opacity.
 """
 
 import cv2
+import functools
+import io
 import numpy as np
 import os
 import math
+import queue
 import questionary
+import re
 import shutil
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from PIL import Image, ImageDraw, ImageFont
 from rich.console import Console
+from rich.markup import escape
 from rich.prompt import Prompt
 
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy blend is used without it
+    njit = None
+
 # Single console instance for Rich-powered interaction
 console = Console()
 
+# Let OpenCV's parallel loops (colour conversion, decode helpers) use every core
+cv2.setNumThreads(os.cpu_count() or 4)
+
+# Frames buffered between the decode, blend and encode stages
+FRAME_QUEUE_SIZE = 8
+
+# Frames decoded and blended together as one (N, H, W, 3) batch, capped so a
+# single batch stays within BATCH_BYTES even for 4K sources
+MAX_BATCH_FRAMES = 8
+BATCH_BYTES = 32 * 1024 * 1024
+
+# Seconds between progress updates printed by the reporter thread
+PROGRESS_INTERVAL = 1.0
+
+# Try common cross-platform font locations; prefer bold variants when available
+FONT_CANDIDATES = [
+    # macOS (bold variants first)
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "/Library/Fonts/Arial Bold.ttf",
+    "/System/Library/Fonts/Arial Bold.ttf",
+    "/System/Library/Fonts/Supplemental/HelveticaNeue.ttf",
+    # Linux
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
+    # Windows
+    "C:\\Windows\\Fonts\\arialbd.ttf",
+    "C:\\Windows\\Fonts\\segoeuib.ttf",
+    # Regular fallbacks
+    "/System/Library/Fonts/Arial.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+    "C:\\Windows\\Fonts\\arial.ttf",
+    "C:\\Windows\\Fonts\\segoeui.ttf",
+]
+
+# File extensions picked up when processing a directory
+VIDEO_EXTENSIONS = frozenset(
+    {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm", ".m4v"}
+)
+
+# Length of the keyframe-aligned pieces a long single video is split into so
+# they can be watermarked in parallel (see add_watermark_split_stitch)
+SPLIT_SEGMENT_SECONDS = 30
+
+# Threads one video's decode and encode may use; None lets OpenCV and ffmpeg
+# use every core. Process-pool workers lower it to their share (_init_worker)
+_worker_threads = None
+
+# Buffer a quiet pool worker prints into instead of the terminal, so its
+# errors and warnings can be handed back to the parent (_init_worker)
+_worker_log = None
+
+# Located once per process; None when ffmpeg is not installed
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+# Keep ffmpeg from flashing a console window on Windows (no-op elsewhere)
+SUBPROCESS_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Audio codecs the MP4 container can carry as-is; anything else is re-encoded
+# to AAC. FLAC and Opus are left out: older ffmpeg builds refuse them in MP4
+# without -strict experimental
+MP4_AUDIO_CODECS = {"aac", "mp3", "alac", "ac3", "eac3"}
+
+# ffmpeg error output that points at an audio stream rather than the video or
+# the output file: audio stream, filter and encoder tags ([aost#0:1/aac @ ...],
+# [af#0:1 @ ...], [aac @ ...]) or the muxer naming a non-video output stream.
+# The watermarked video is always output stream 0
+AUDIO_ERROR_PATTERN = re.compile(
+    r"\[(?:aost|aist|af|adec)#|\[aac @|\bin stream #[1-9]|\boutput stream #?0:[1-9]"
+)
+
+# ffmpeg video encoders in order of preference (hardware first) and their options
+VIDEO_ENCODERS = [
+    (
+        "h264_nvenc",
+        ("-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23", "-pix_fmt", "yuv420p"),
+    ),
+    ("h264_videotoolbox", ("-q:v", "65", "-pix_fmt", "yuv420p")),
+    ("h264_qsv", ("-preset", "veryfast", "-global_quality", "23", "-pix_fmt", "nv12")),
+    ("libx264", ("-preset", "veryfast", "-threads", "0", "-pix_fmt", "yuv420p")),
+    ("mpeg4", ("-q:v", "3", "-threads", "0", "-pix_fmt", "yuv420p")),
+]
+
+# Encoders backed by a GPU or media engine; these only allow a few concurrent
+# sessions (consumer NVIDIA cards refuse more than a handful), so parallel
+# jobs using one are capped at HARDWARE_ENCODER_SESSIONS
+HARDWARE_ENCODERS = {"h264_nvenc", "h264_videotoolbox", "h264_qsv"}
+HARDWARE_ENCODER_SESSIONS = 2
+
 
 def process_directory(directory_path, text_line1, text_line2, coverage_pct, opacity_pct):
     """Process all video files in a directory."""
-    video_extensions = [
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".mkv",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".m4v",
-    ]
-    video_files = []
-
-    # Find all video files in the directory
-    for file in os.listdir(directory_path):
-        if any(file.lower().endswith(ext) for ext in video_extensions):
-            video_files.append(os.path.join(directory_path, file))
+    # Find all video files in the directory (scandir entries carry their type,
+    # so no extra stat per file)
+    with os.scandir(directory_path) as entries:
+        video_files = [
+            entry.path
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+            and entry.is_file()
+        ]
 
     if not video_files:
         console.print(
@@ -48,21 +148,57 @@ def process_directory(directory_path, text_line1, text_line2, coverage_pct, opac
     for i, video_file in enumerate(video_files, 1):
         console.print(f"  {i}. {os.path.basename(video_file)}")
 
-    console.print("\nProcessing videos...")
+    # Reserve output names up front so parallel workers never pick the same file
+    reserved_paths = set()
+    existing_names = _list_names(directory_path)
+    jobs = []
+    for video_file in video_files:
+        output_path = get_unique_output_path(
+            video_file, reserved_paths, existing_names)
+        reserved_paths.add(output_path)
+        jobs.append(
+            (video_file, output_path, text_line1, text_line2, coverage_pct, opacity_pct)
+        )
+
+    # Each video is independent, so spread them across processes; the encoder
+    # is multi-threaded too, so leave headroom instead of using every core
+    max_workers = min(len(video_files), max(1, (os.cpu_count() or 1) // 2))
+    max_workers = _parallel_encode_limit(max_workers)
+    console.print(
+        f"\nProcessing videos with [bold]{max_workers}[/] worker(s)...")
     successful = 0
     failed = 0
 
-    for i, video_file in enumerate(video_files, 1):
-        console.print(
-            f"\n[bold cyan]--- Processing video {i}/{len(video_files)}:[/] {os.path.basename(video_file)} ---"
-        )
-        success = add_watermark_to_video(
-            video_file, text_line1, text_line2, coverage_pct, opacity_pct
-        )
-        if success:
-            successful += 1
-        else:
-            failed += 1
+    # Split the cores between workers so OpenCV's thread pools don't oversubscribe
+    threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+    # Workers stay quiet so their progress lines don't interleave; each video
+    # is reported here as it completes, with any errors and warnings it hit
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(threads_per_worker, True),
+    ) as executor:
+        futures = {
+            executor.submit(_watermark_video_job, job): job[0] for job in jobs
+        }
+        # Report each video as soon as it finishes rather than in listing order
+        for i, future in enumerate(as_completed(futures), 1):
+            video_file = futures[future]
+            try:
+                success, messages = future.result()
+            except Exception as e:
+                # e.g. a worker process died (BrokenProcessPool)
+                success, messages = False, [f"Error: {str(e)}"]
+            status = "[green]done[/]" if success else "[red]failed[/]"
+            console.print(
+                f"\n[bold cyan]--- Video {i}/{len(video_files)} {status}:[/] {os.path.basename(video_file)} ---"
+            )
+            for message in messages:
+                console.print("  " + message.replace("\n", "\n  "), markup=False)
+            if success:
+                successful += 1
+            else:
+                failed += 1
 
     console.print("\n[bold green]=== Batch Processing Complete ===[/]")
     console.print(f"Successfully processed: [bold]{successful}[/] videos")
@@ -71,30 +207,167 @@ def process_directory(directory_path, text_line1, text_line2, coverage_pct, opac
     return successful > 0
 
 
-def get_unique_output_path(source_path):
-    """Generate a unique output path beside the source video."""
+class _PrintLog(io.StringIO):
+    """Console sink for a quiet pool worker that keeps each print as one entry."""
+
+    def __init__(self):
+        super().__init__()
+        self.entries = []
+
+    def write(self, text):
+        self.entries.append(text)
+        return len(text)
+
+
+def _init_worker(threads_per_worker, quiet=False):
+    """Process-pool initializer that limits a worker to its share of cores.
+
+    The budget applies to OpenCV, Numba and the ffmpeg decoder and encoder.
+    ``quiet`` sends the worker's console output to a buffer instead of the
+    terminal, for jobs the parent reports on (see _watermark_video_job).
+    """
+    global _worker_threads, _worker_log, console
+    _worker_threads = threads_per_worker
+    cv2.setNumThreads(threads_per_worker)
+    if njit is not None:
+        # Numba refuses more threads than its pool was started with
+        numba.set_num_threads(min(threads_per_worker, numba.config.NUMBA_NUM_THREADS))
+    if quiet:
+        _worker_log = _PrintLog()
+        console = Console(file=_worker_log, color_system=None, soft_wrap=True)
+
+
+def _watermark_video_job(job):
+    """Process-pool entry point that watermarks one video without raising.
+
+    Returns (success, messages). In a quiet worker ``messages`` holds the
+    error and warning messages the job printed, for the parent to show; in a
+    normal worker they already reached the terminal and the list is empty.
+    """
+    video_file, output_path, text_line1, text_line2, coverage_pct, opacity_pct = job
+    if _worker_log is not None:
+        _worker_log.entries.clear()
+    console.print(
+        f"\n[bold cyan]--- Processing video:[/] {os.path.basename(video_file)} ---")
+    try:
+        success = add_watermark_to_video(
+            video_file,
+            text_line1,
+            text_line2,
+            coverage_pct,
+            opacity_pct,
+            output_path=output_path,
+        )
+    except Exception as e:
+        console.print(
+            f"\n[bold red]Error:[/] {os.path.basename(video_file)}: {escape(str(e))}")
+        success = False
+    messages = []
+    if _worker_log is not None:
+        # Keep every Error/Warning print whole (ffmpeg's output spans several
+        # lines), along with the indented detail prints that follow it
+        keep = False
+        for entry in _worker_log.entries:
+            text = entry.strip("\n")
+            if text.startswith(("Error:", "Warning:")):
+                keep = True
+            elif not (keep and text.startswith("  ")):
+                keep = False
+            if keep:
+                messages.append(text)
+    return success, messages
+
+
+def _parallel_encode_limit(max_workers):
+    """Cap ``max_workers`` to what the selected ffmpeg video encoder allows."""
+    if FFMPEG_PATH and select_video_encoder(FFMPEG_PATH)[0] in HARDWARE_ENCODERS:
+        return min(max_workers, HARDWARE_ENCODER_SESSIONS)
+    return max_workers
+
+
+def get_unique_output_path(source_path, reserved_paths=(), existing_names=None):
+    """Generate a unique output path beside the source video.
+
+    Paths in ``reserved_paths`` are treated as taken even if not yet on disk.
+    ``existing_names`` is an optional listing from _list_names for the output
+    directory, so batches can share one scan instead of probing every name.
+    When the directory can't be listed, each name is checked on disk instead.
+    """
     output_dir = os.path.dirname(source_path)
     base_name = os.path.splitext(os.path.basename(source_path))[0]
-    base_output_path = os.path.join(output_dir, f"{base_name}_watermarked.mp4")
-
-    if not os.path.exists(base_output_path):
-        return base_output_path
+    if existing_names is None:
+        existing_names = _list_names(output_dir)
+
+    def is_free(file_name):
+        path = os.path.join(output_dir, file_name)
+        if path in reserved_paths:
+            return False
+        if existing_names is None:
+            return not os.path.exists(path)
+        # Compare case-insensitively so macOS/Windows clashes are caught too
+        return file_name.lower() not in existing_names
+
+    base_output_name = f"{base_name}_watermarked.mp4"
+    if is_free(base_output_name):
+        return os.path.join(output_dir, base_output_name)
 
     counter = 1
     while True:
         if counter == 1:
-            copy_path = os.path.join(
-                output_dir, f"{base_name}_watermarked_copy.mp4")
+            copy_name = f"{base_name}_watermarked_copy.mp4"
         else:
-            copy_path = os.path.join(
-                output_dir, f"{base_name}_watermarked_copy{counter}.mp4")
+            copy_name = f"{base_name}_watermarked_copy{counter}.mp4"
 
-        if not os.path.exists(copy_path):
-            return copy_path
+        if is_free(copy_name):
+            return os.path.join(output_dir, copy_name)
 
         counter += 1
 
 
+def _list_names(directory_path):
+    """Return the lowercased names of every entry in a directory (one scan).
+
+    Returns None when the directory can't be listed, so callers probe each
+    name instead of treating every name as free.
+    """
+    try:
+        with os.scandir(directory_path or ".") as entries:
+            return {entry.name.lower() for entry in entries}
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_path():
+    """Return the first usable font in FONT_CANDIDATES, or None."""
+    for path in FONT_CANDIDATES:
+        if os.path.exists(path):
+            try:
+                ImageFont.truetype(path, 60)
+                return path
+            except Exception:
+                pass
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(size):
+    """Load the resolved font at ``size``, falling back to Pillow's default."""
+    font_path = _resolve_font_path()
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_bbox(size, text):
+    """Return the bounding box of ``text`` at font ``size`` from glyph metrics."""
+    return _get_font(size).getbbox(text)
+
+
 def create_watermark_overlay(
     frame_width,
     frame_height,
@@ -116,59 +389,19 @@ def create_watermark_overlay(
     base_font_size = max(
         60, min((watermark_width // 5), (watermark_height // 6)))
 
-    # Try common cross-platform font locations; prefer bold variants when available
-    font_candidates = [
-        # macOS (bold variants first)
-        "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-        "/Library/Fonts/Arial Bold.ttf",
-        "/System/Library/Fonts/Arial Bold.ttf",
-        "/System/Library/Fonts/Supplemental/HelveticaNeue.ttf",
-        # Linux
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-        "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
-        # Windows
-        "C:\\Windows\\Fonts\\arialbd.ttf",
-        "C:\\Windows\\Fonts\\segoeuib.ttf",
-        # Regular fallbacks
-        "/System/Library/Fonts/Arial.ttf",
-        "/Library/Fonts/Arial.ttf",
-        "/System/Library/Fonts/Supplemental/Arial.ttf",
-        "/System/Library/Fonts/Helvetica.ttc",
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-        "C:\\Windows\\Fonts\\arial.ttf",
-        "C:\\Windows\\Fonts\\segoeui.ttf",
-    ]
-    font_path = None
-    for path in font_candidates:
-        if os.path.exists(path):
-            try:
-                ImageFont.truetype(path, base_font_size)
-                font_path = path
-                break
-            except Exception:
-                pass
-    if font_path is None:
-        font = ImageFont.load_default()
-    else:
-        font = ImageFont.truetype(font_path, base_font_size)
+    # Fonts are resolved and loaded once per process, then reused
+    font_path = _resolve_font_path()
+    font_size = base_font_size
 
-    def load_font(size: float) -> ImageFont.ImageFont:
-        if font_path:
-            adjusted = max(10, int(round(size)))
-            try:
-                return ImageFont.truetype(font_path, adjusted)
-            except Exception:
-                pass
-        return ImageFont.load_default()
+    def font_size_for(size: float) -> int:
+        return max(10, int(round(size)))
 
-    def measure_text(font_obj: ImageFont.ImageFont):
+    def measure_text(size: int):
         lines = []
         for text_value in (text_line1, text_line2):
             if not text_value.strip():
                 continue
-            bbox = draw.textbbox((0, 0), text_value, font=font_obj)
+            bbox = _text_bbox(size, text_value)
             if not bbox:
                 continue
             width = bbox[2] - bbox[0]
@@ -183,7 +416,7 @@ def create_watermark_overlay(
             )
 
         if not lines:
-            # Fallback: include first line even if draw.textbbox failed (should be rare)
+            # Fallback: include first line even if getbbox failed (should be rare)
             fallback_text = text_line1 if text_line1.strip() else text_line2
             width = 0
             height = 0
@@ -209,43 +442,33 @@ def create_watermark_overlay(
             "max_width": max_text_width,
         }
 
-    metrics = measure_text(font)
+    metrics = measure_text(font_size)
 
     # Scale font size so the widest text line approximates the requested frame coverage
     target_width_ratio = max(coverage_pct, 1.0) / 100.0
     target_width_ratio = min(target_width_ratio, 1.0)
 
-    if font_path and watermark_width > 0:
+    if font_path and watermark_width > 0 and metrics["max_width"] > 0:
+        # Rendered text scales almost linearly with font size, so solve for the
+        # size directly from one measurement, then refine once to absorb
+        # hinting and integer-size rounding
         current_size = float(base_font_size)
-        for _ in range(6):
-            width_ratio = (metrics["max_width"] /
-                           watermark_width) if watermark_width else 0.0
-            if width_ratio <= 0:
-                break
-
+        for _ in range(2):
+            width_ratio = metrics["max_width"] / watermark_width
             height_ratio = (metrics["total_height"] /
                             watermark_height) if watermark_height else 0.0
-            # Prevent oversized height before attempting further scaling
-            if height_ratio > 0.9:
-                current_size = current_size * (0.9 / max(height_ratio, 1e-6))
-                font = load_font(current_size)
-                metrics = measure_text(font)
-                continue
-
-            if abs(width_ratio - target_width_ratio) <= 0.02:
+            if abs(width_ratio - target_width_ratio) <= 0.02 and height_ratio <= 0.9:
                 break
 
-            scale_factor = target_width_ratio / max(width_ratio, 1e-6)
-            current_size = current_size * scale_factor
-            # Keep font size within sane bounds relative to frame height
-            max_size = watermark_height * 0.9
-            if current_size > max_size:
-                current_size = max_size
-            font = load_font(current_size)
-            metrics = measure_text(font)
-
-    # Recompute metrics one final time in case we exited early without an update
-    metrics = measure_text(font)
+            scale_factor = target_width_ratio / width_ratio
+            # Never let the text block grow past 90% of the frame height
+            if height_ratio > 0:
+                scale_factor = min(scale_factor, 0.9 / height_ratio)
+            current_size = min(current_size * scale_factor,
+                               watermark_height * 0.9)
+            font_size = font_size_for(current_size)
+            metrics = measure_text(font_size)
+
     lines = metrics["lines"]
     spacing = metrics["spacing"]
     total_text_height = metrics["total_height"]
@@ -265,7 +488,7 @@ def create_watermark_overlay(
         line_height = line["height"]
         x = (watermark_width - line_width) / 2.0 - bbox[0]
         y = current_y - bbox[1]
-        draw.text((x, y), line["text"], font=font, fill=text_color)
+        draw.text((x, y), line["text"], font=_get_font(font_size), fill=text_color)
         current_y += line_height
         if idx < len(lines) - 1:
             current_y += spacing
@@ -273,71 +496,521 @@ def create_watermark_overlay(
     return overlay
 
 
-def mux_audio_into_video(original_video_path, watermarked_video_path, final_output_path):
-    """Attempt to copy the original audio track into the processed video using ffmpeg."""
+@functools.lru_cache(maxsize=8)
+def crop_watermark_overlay(
+    frame_width,
+    frame_height,
+    text_line1,
+    text_line2,
+    coverage_pct,
+    opacity_pct,
+):
+    """Render the overlay and crop it to the drawn text.
 
-    ffmpeg_path = shutil.which("ffmpeg")
-    if not ffmpeg_path:
-        console.print(
-            "[bold yellow]Warning:[/] ffmpeg not found; output video will not include audio."
+    Returns (image, bbox) where bbox is (x0, y0, x1, y1) in frame coordinates,
+    or None when nothing is visible (e.g. 0% opacity). Cached, so the image
+    is shared between videos and must not be modified.
+    """
+    watermark_overlay = create_watermark_overlay(
+        frame_width,
+        frame_height,
+        text_line1,
+        text_line2,
+        coverage_pct,
+        opacity_pct,
+    )
+    # Let Pillow find the text's bounding box from the alpha channel so only
+    # that crop is ever converted or composited, never the full-frame canvas
+    bbox = watermark_overlay.getchannel("A").getbbox()
+    if bbox:
+        # Start on even coordinates: ffmpeg's overlay rounds odd positions
+        # down on 4:2:0 video, which would shift the text by a pixel
+        bbox = (bbox[0] - bbox[0] % 2, bbox[1] - bbox[1] % 2, bbox[2], bbox[3])
+    x0, y0, x1, y1 = bbox if bbox else (0, 0, 0, 0)
+    return watermark_overlay.crop((x0, y0, x1, y1)), bbox
+
+
+@functools.lru_cache(maxsize=8)
+def prepare_watermark_overlay(
+    frame_width,
+    frame_height,
+    text_line1,
+    text_line2,
+    coverage_pct,
+    opacity_pct,
+):
+    """Render the overlay and precompute the fixed-point data used to blend it.
+
+    Cached so batches of same-sized videos only rasterize the text once. The
+    returned arrays are read-only because they are shared between videos.
+    """
+    # Only the text's bounding box needs blending
+    watermark_crop, bbox = crop_watermark_overlay(
+        frame_width,
+        frame_height,
+        text_line1,
+        text_line2,
+        coverage_pct,
+        opacity_pct,
+    )
+    x0, y0, x1, y1 = bbox if bbox else (0, 0, 0, 0)
+    overlay_rgba = np.asarray(watermark_crop)
+    # The text is drawn in solid white, so the overlay colour is a constant
+    # 255 on every channel and only its alpha needs to be kept
+    overlay_alpha = overlay_rgba[:, :, 3]
+    # Blend in 8.8 fixed point: alpha scaled to 0-256 so that fully opaque
+    # pixels are exact. With a white overlay f*(256-a) + 255*a reduces to
+    # 256*f + (255-f)*a, so the blend is f + ((255-f)*a >> 8), which stays
+    # in uint16 range. The uint8 alpha is bounded, so no float clamp is needed
+    alpha_q8 = (
+        (overlay_alpha.astype(np.uint16) * 256 + 127) // 255
+    )[..., None]
+    # Expand alpha to every channel and flatten rows to (h, w*3) so the blend
+    # walks it byte for byte alongside the frame, with no broadcasting
+    roi_height, roi_width = y1 - y0, x1 - x0
+    alpha_q8 = np.ascontiguousarray(
+        np.broadcast_to(alpha_q8, (roi_height, roi_width, 3))
+    ).reshape(roi_height, roi_width * 3)
+    alpha_q8.flags.writeable = False
+    # Runs of visible bytes in each row as (row, start, end): the JIT kernel
+    # blends only these and skips the transparent gaps between glyph strokes
+    visible = np.zeros((roi_height, roi_width * 3 + 2), np.int8)
+    visible[:, 1:-1] = alpha_q8 != 0
+    edges = np.diff(visible, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    run_ends = np.nonzero(edges == -1)[1]
+    runs = np.stack([run_rows, run_starts, run_ends], axis=1).astype(np.int64)
+    runs.flags.writeable = False
+
+    return {
+        # Nothing visible to draw (e.g. 0% opacity): frames pass through as-is
+        "is_blank": bbox is None,
+        "roi": (y0, y1, x0, x1),
+        "alpha_q8": alpha_q8,
+        "runs": runs,
+    }
+
+
+def audio_codec_options(ffmpeg_path, video_path):
+    """Return ffmpeg options that carry every source audio stream into an MP4.
+
+    Each stream is copied when MP4 can hold its codec, otherwise it is
+    re-encoded to AAC. Returns an empty list when the source has no audio.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-i", video_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=SUBPROCESS_FLAGS,
+            check=False,
         )
-        return False
+        probe_output = result.stderr.decode("utf-8", errors="ignore")
+    except OSError:
+        probe_output = ""
+
+    options = []
+    codecs = re.findall(r"Stream #0:\d+[^:]*: Audio:\s*([\w-]+)", probe_output)
+    for index, codec in enumerate(codecs):
+        if codec in MP4_AUDIO_CODECS:
+            options += [f"-c:a:{index}", "copy"]
+        else:
+            options += [f"-c:a:{index}", "aac", f"-b:a:{index}", "192k"]
+    return options
 
-    cmd = [
-        ffmpeg_path,
-        "-y",
-        "-loglevel",
-        "error",
-        "-i",
-        watermarked_video_path,
-        "-i",
-        original_video_path,
-        "-map",
-        "0:v:0",
-        "-map",
-        "1:a?",
-        "-c:v",
-        "copy",
-        "-c:a",
-        "copy",
-        "-movflags",
-        "+faststart",
-        final_output_path,
-    ]
 
+def _run_ffmpeg(cmd, log_path, progress=None):
+    """Run an ffmpeg command and return (returncode, error output).
+
+    When ``progress`` is given the command must write ``-progress pipe:1``;
+    its frame count is copied into progress["frames"] as ffmpeg reports it.
+    """
+    # Errors go to a file: a chatty decoder could fill a stderr pipe while
+    # stdout is being read and stall ffmpeg
+    with open(log_path, "wb") as log_file:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=log_file,
+                creationflags=SUBPROCESS_FLAGS,
+            )
+        except OSError as exc:
+            return -1, str(exc)
+        for line in proc.stdout:
+            key, _, value = line.partition(b"=")
+            if progress is not None and key == b"frame" and value.strip().isdigit():
+                progress["frames"] = int(value)
+        returncode = proc.wait()
+    with open(log_path, "rb") as log_file:
+        error_output = log_file.read().decode("utf-8", errors="ignore").strip()
+    return returncode, error_output
+
+
+if njit is not None:
+
+    # boundscheck pinned off so NUMBA_BOUNDSCHECK debugging can't slow it down
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _blend_rows_jit(frame_rows, y0, byte_x0, alpha_q8, runs):
+        # Straight-line subtract/multiply/shift/add over contiguous bytes so
+        # LLVM emits the widen/multiply/pack SIMD sequence (AVX2 on x86, NEON
+        # on ARM); the visible runs of every frame in the batch are spread
+        # across threads
+        run_count = runs.shape[0]
+        for job in prange(frame_rows.shape[0] * run_count):
+            y, start, end = runs[job % run_count]
+            row = frame_rows[job // run_count, y0 + y]
+            alpha = alpha_q8[y]
+            for i in range(start, end):
+                value = row[byte_x0 + i]
+                row[byte_x0 + i] = value + (((255 - value) * alpha[i]) >> 8)
+
+else:
+    _blend_rows_jit = None
+
+
+@functools.lru_cache(maxsize=None)
+def _warm_up_blend_jit():
+    """Compile (or load from Numba's cache) the blend kernel once per process."""
+    if _blend_rows_jit is None:
+        return
+    # Same argument types as the real call, including the read-only alpha,
+    # so the frame loop reuses this specialization instead of compiling one
+    alpha_q8 = np.zeros((1, 3), np.uint16)
+    alpha_q8.flags.writeable = False
+    runs = np.zeros((1, 3), np.int64)
+    runs.flags.writeable = False
+    _blend_rows_jit(np.zeros((1, 1, 3), np.uint8), 0, 0, alpha_q8, runs)
+
+
+def blend_watermark(frames, watermark, scratch=None):
+    """Blend a prepared watermark into C-contiguous BGR frames in place.
+
+    ``frames`` is a single (H, W, 3) frame or an (N, H, W, 3) batch. ``scratch``
+    is an optional uint16 buffer of shape (N, *watermark["alpha_q8"].shape)
+    that the NumPy fallback reuses across batches instead of allocating its own.
+    """
+    y0, y1, x0, x1 = watermark["roi"]
+    alpha_q8 = watermark["alpha_q8"]
+    # View each frame row as flat B,G,R bytes so per-channel data lines up
+    height, width = frames.shape[-3:-1]
+    frame_rows = frames.reshape(-1, height, width * 3)
+    if _blend_rows_jit is not None:
+        _blend_rows_jit(frame_rows, y0, x0 * 3, alpha_q8, watermark["runs"])
+    else:
+        # frame + (white - frame) * a, chained in one scratch buffer and
+        # broadcast across the whole batch in each call
+        roi = frame_rows[:, y0:y1, x0 * 3:x1 * 3]
+        if scratch is None or len(scratch) < len(roi):
+            scratch = np.empty(roi.shape, np.uint16)
+        scratch = scratch[:len(roi)]
+        np.subtract(255, roi, out=scratch)
+        np.multiply(scratch, alpha_q8, out=scratch)
+        np.right_shift(scratch, 8, out=scratch)
+        np.add(roi, scratch, out=roi, casting="unsafe")
+
+
+@functools.lru_cache(maxsize=None)
+def select_video_encoder(ffmpeg_path):
+    """Return the first (name, options) in VIDEO_ENCODERS that works with this ffmpeg."""
     try:
         result = subprocess.run(
-            cmd,
+            [ffmpeg_path, "-hide_banner", "-encoders"],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=SUBPROCESS_FLAGS,
             check=False,
         )
-    except Exception as exc:
-        console.print(
-            f"[bold yellow]Warning:[/] Failed to run ffmpeg to copy audio ({exc}). Video will be silent."
-        )
-        return False
+        listing = result.stdout.decode("utf-8", errors="ignore")
+    except OSError:
+        listing = ""
+    available = {
+        fields[1] for fields in (line.split() for line in listing.splitlines())
+        if len(fields) > 1
+    }
+
+    for name, options in VIDEO_ENCODERS[:-1]:
+        if name not in available:
+            continue
+        # Being compiled in doesn't mean the hardware is present; encode one
+        # tiny test frame to make sure the encoder really works
+        probe_cmd = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=black:s=256x256:d=0.1",
+            "-frames:v",
+            "1",
+            "-c:v",
+            name,
+            *options,
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            probe = subprocess.run(
+                probe_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=20,
+                creationflags=SUBPROCESS_FLAGS,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if probe.returncode == 0:
+            return name, options
+
+    # ffmpeg's built-in MPEG-4 encoder is always available as a last resort
+    return VIDEO_ENCODERS[-1]
+
 
-    if result.returncode != 0:
-        stderr_output = result.stderr.decode("utf-8", errors="ignore").strip()
-        if stderr_output:
+def _watermark_with_ffmpeg(
+    video_path,
+    output_path,
+    frame_size,
+    total_frames,
+    text_line1,
+    text_line2,
+    coverage_pct,
+    opacity_pct,
+):
+    """Watermark a video entirely inside ffmpeg and report whether it worked.
+
+    The text is rendered once with Pillow (same font and sizing as the OpenCV
+    path) and composited by ffmpeg's overlay filter, so frames never leave
+    ffmpeg. The original audio is muxed in the same pass.
+    """
+    frame_width, frame_height = frame_size
+    encoder_name, encoder_options = select_video_encoder(FFMPEG_PATH)
+    console.print(f"Encoder: {encoder_name}")
+    watermark_crop, bbox = crop_watermark_overlay(
+        frame_width,
+        frame_height,
+        text_line1,
+        text_line2,
+        coverage_pct,
+        opacity_pct,
+    )
+    thread_options = ["-threads", str(_worker_threads)] if _worker_threads else []
+
+    # Nothing visible to draw (e.g. 0% opacity): re-encode without the overlay
+    if bbox:
+        # Blend straight into the decoded 4:2:0 planes, so frames are never
+        # converted to RGB; only the small overlay PNG is. Chroma is blended
+        # too: white text pulls U/V toward neutral, and a luma-only blend
+        # would leave colour showing through the text
+        graph = f"[0:v:0][1:v]overlay={bbox[0]}:{bbox[1]}:format=yuv420"
+    else:
+        graph = "[0:v:0]null"
+    if frame_width % 2 or frame_height % 2:
+        # yuv420p needs even dimensions; pad odd-sized sources by one pixel
+        graph += ",pad=ceil(iw/2)*2:ceil(ih/2)*2"
+    graph += "[v]"
+
+    with tempfile.TemporaryDirectory(prefix="watermark_") as temp_dir:
+        overlay_path = os.path.join(temp_dir, "overlay.png")
+        log_path = os.path.join(temp_dir, "ffmpeg.log")
+        input_options = [
+            FFMPEG_PATH,
+            "-y",
+            "-nostdin",
+            "-loglevel",
+            "error",
+            *thread_options,
+            "-i",
+            video_path,
+        ]
+        if bbox:
+            watermark_crop.save(overlay_path)
+            input_options += ["-i", overlay_path]
+        output_options = [
+            "-c:v",
+            encoder_name,
+            *encoder_options,
+            # Overrides the encoder's own "-threads 0" (all cores) in workers
+            *thread_options,
+            "-movflags",
+            "+faststart",
+            # Machine-readable progress on stdout instead of the stats line
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            output_path,
+        ]
+        audio_options = audio_codec_options(FFMPEG_PATH, video_path)
+
+        def build_command(with_audio):
+            if with_audio and audio_options:
+                audio = ["-map", "0:a?", *audio_options]
+            else:
+                audio = ["-an"]
+            return [
+                *input_options,
+                "-filter_complex",
+                graph,
+                "-map",
+                "[v]",
+                *audio,
+                *output_options,
+            ]
+
+        console.print("\nProcessing video...")
+        progress = {"frames": 0}
+        stop_reporting = _start_progress_reporter(progress, total_frames)
+        returncode, error_output = _run_ffmpeg(
+            build_command(with_audio=True), log_path, progress)
+        if returncode != 0 and audio_options and AUDIO_ERROR_PATTERN.search(error_output):
+            # Keep the watermarked video even if its audio can't be carried over
             console.print(
-                "[bold yellow]Warning:[/] ffmpeg could not copy audio; video will be silent."
-            )
-            console.print(f"  ffmpeg output: {stderr_output}")
-        else:
+                "[bold yellow]Warning:[/] ffmpeg could not copy audio; video will be silent.")
+            console.print(f"  ffmpeg output: {escape(error_output)}")
+            progress["frames"] = 0
+            returncode, error_output = _run_ffmpeg(
+                build_command(with_audio=False), log_path, progress)
+        stop_reporting()
+
+        if returncode != 0:
             console.print(
-                "[bold yellow]Warning:[/] ffmpeg could not copy audio; video will be silent."
-            )
-        return False
+                f"[bold red]Error:[/] ffmpeg failed while watermarking ({escape(error_output)}).")
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            return False
 
     return True
 
 
-def add_watermark_to_video(video_path, text_line1, text_line2, coverage_pct, opacity_pct):
+def _read_frames(cap, free_buffers, frame_queue, errors):
+    """Decode batches of frames on a background thread, ending with None.
+
+    Frames are decoded straight into (N, H, W, 3) batches taken from
+    ``free_buffers`` and queued as (batch, frame_count) pairs, so no new
+    arrays are allocated once the pool is primed.
+    """
+    try:
+        finished = False
+        while not finished:
+            batch = free_buffers.get()
+            count = 0
+            while count < len(batch):
+                slot = batch[count]
+                ret, frame = cap.read(slot)
+                if not ret:
+                    finished = True
+                    break
+                if frame is not slot:
+                    # Backend allocated its own array; copy it into the batch
+                    slot[...] = frame
+                count += 1
+            if count:
+                frame_queue.put((batch, count))
+    except Exception as exc:
+        errors.append(exc)
+    finally:
+        frame_queue.put(None)
+
+
+def _write_frames(writer, frame_queue, free_buffers, errors):
+    """Encode batches of frames on a background thread until None arrives.
+
+    Each written batch is handed back to ``free_buffers`` for the reader.
+    """
+    while True:
+        item = frame_queue.get()
+        if item is None:
+            break
+        batch, count = item
+        # After a failure keep draining (and recycling) so nothing blocks
+        if not errors:
+            try:
+                for frame in batch[:count]:
+                    writer.write(frame)
+            except Exception as exc:
+                errors.append(exc)
+        free_buffers.put(batch)
+
+    # The writer owns the encoder, so flush it here where failures are captured
+    try:
+        writer.release()
+    except Exception as exc:
+        errors.append(exc)
+
+
+def _report_progress(progress, total_frames, stop_event):
+    """Print progress from a background thread until stop_event is set."""
+    # Only report whole-percent steps so long videos don't flood the console
+    frames_per_step = max(1, total_frames // 100)
+    last_reported = 0
+    while not stop_event.wait(PROGRESS_INTERVAL):
+        frames_done = progress["frames"]
+        if frames_done - last_reported >= frames_per_step:
+            console.print(
+                f"Progress: {(frames_done / total_frames) * 100:.1f}%")
+            last_reported = frames_done
+
+
+def _start_progress_reporter(progress, total_frames):
+    """Report ``progress["frames"]`` from a background thread.
+
+    Returns a function that stops the reporter; nothing is printed when the
+    frame count is unknown.
+    """
+    stop_event = threading.Event()
+    reporter = None
+    if total_frames > 0:
+        reporter = threading.Thread(
+            target=_report_progress,
+            args=(progress, total_frames, stop_event),
+            daemon=True,
+        )
+        reporter.start()
+
+    def stop():
+        stop_event.set()
+        if reporter is not None:
+            reporter.join()
+
+    return stop
+
+
+def _open_capture(video_path, decode=True):
+    """Open ``video_path``, preferring OpenCV's FFmpeg backend.
+
+    Pass ``decode=False`` when only the metadata is read, so no GPU decoder
+    or decode threads are set up for frames that are never decoded.
+    """
+    # Ask for GPU decode (NVDEC, VideoToolbox, VA-API, D3D11...) and for the
+    # decoder to use every core; OpenCV silently ignores what it can't do
+    params = []
+    if decode and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        params += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    if decode and hasattr(cv2, "CAP_PROP_N_THREADS"):
+        params += [cv2.CAP_PROP_N_THREADS, _worker_threads or os.cpu_count() or 4]
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
+    if not cap.isOpened():
+        # OpenCV built without FFmpeg: let it pick any backend that can read it
+        cap = cv2.VideoCapture(video_path, cv2.CAP_ANY)
+    return cap
+
+
+def add_watermark_to_video(
+    video_path,
+    text_line1,
+    text_line2,
+    coverage_pct,
+    opacity_pct,
+    output_path=None,
+):
     """Add watermark to video and save the result."""
-    # Open video
-    cap = cv2.VideoCapture(video_path)
+    # With ffmpeg the capture only supplies metadata; ffmpeg does the decoding
+    cap = _open_capture(video_path, decode=FFMPEG_PATH is None)
 
     if not cap.isOpened():
         console.print("[bold red]Error:[/] Could not open video file.")
@@ -357,27 +1030,68 @@ def add_watermark_to_video(video_path, text_line1, text_line2, coverage_pct, opa
     console.print(f"Total frames: {total_frames}")
 
     # Create output filename with unique path handling
-    output_path = get_unique_output_path(video_path)
+    if output_path is None:
+        output_path = get_unique_output_path(video_path)
 
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Define codec and create VideoWriter
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    temp_video_path = f"{output_path}.video-only.mp4"
-    if os.path.exists(temp_video_path):
-        os.remove(temp_video_path)
+    # With ffmpeg the whole job runs inside it: hardware or multi-threaded
+    # H.264, the overlay filter and the original audio in one pass
+    if FFMPEG_PATH:
+        cap.release()
+        if not _watermark_with_ffmpeg(
+            video_path,
+            output_path,
+            (frame_width, frame_height),
+            total_frames,
+            text_line1,
+            text_line2,
+            coverage_pct,
+            opacity_pct,
+        ):
+            return False
+        console.print(
+            f"\n[bold green]Watermarked video saved as:[/] {output_path}")
+        return True
 
-    out = cv2.VideoWriter(temp_video_path, fourcc, fps,
-                          (frame_width, frame_height))
+    # Without ffmpeg, decode, blend and encode frames through OpenCV
+    console.print(
+        "[bold yellow]Warning:[/] ffmpeg not found; output video will not include audio."
+    )
+    # Use OpenCV's H.264 encoder when its build ships one, else mp4v, and
+    # finally mp4v through whichever backend OpenCV picks (builds without
+    # its FFmpeg backend). Silencing OpenCV's logging only hides its own
+    # "failed to open" noise; FFmpeg inside OpenCV may still print why an
+    # H.264 encoder couldn't be configured before mp4v takes over
+    writer_attempts = [
+        (cv2.CAP_FFMPEG, "avc1"),
+        (cv2.CAP_FFMPEG, "mp4v"),
+        (None, "mp4v"),
+    ]
+    log_level = cv2.utils.logging.getLogLevel()
+    cv2.utils.logging.setLogLevel(cv2.utils.logging.LOG_LEVEL_SILENT)
+    try:
+        for api, codec in writer_attempts:
+            fourcc = cv2.VideoWriter_fourcc(*codec)
+            if api is None:
+                out = cv2.VideoWriter(output_path, fourcc, fps,
+                                      (frame_width, frame_height))
+            else:
+                out = cv2.VideoWriter(output_path, api, fourcc, fps,
+                                      (frame_width, frame_height))
+            if out.isOpened():
+                break
+    finally:
+        cv2.utils.logging.setLogLevel(log_level)
     if not out.isOpened():
         console.print(
-            "[bold red]Error:[/] Could not open VideoWriter with codec 'mp4v'.")
+            "[bold red]Error:[/] Could not open a video writer for the output.")
         cap.release()
         return False
 
-    # Create watermark overlay once and prepare per-pixel alpha compositing
-    watermark_overlay = create_watermark_overlay(
+    # Build (or reuse from an earlier video) the per-pixel alpha compositing data
+    watermark = prepare_watermark_overlay(
         frame_width,
         frame_height,
         text_line1,
@@ -385,61 +1099,274 @@ def add_watermark_to_video(video_path, text_line1, text_line2, coverage_pct, opa
         coverage_pct,
         opacity_pct,
     )
-    overlay_rgba = np.array(watermark_overlay)
-    overlay_bgr = cv2.cvtColor(overlay_rgba[:, :, :3], cv2.COLOR_RGB2BGR)
-    overlay_alpha = overlay_rgba[:, :, 3].astype(np.float32) / 255.0
-    # Optional global strength multiplier (1.0 uses overlay alpha as-is)
-    strength = 1.0
-    mask = np.clip(overlay_alpha * strength, 0.0, 1.0)
-    overlay_float = overlay_bgr.astype(np.float32)
+    # Blend several frames per call to amortize per-frame Python overhead
+    frame_bytes = max(1, frame_width * frame_height * 3)
+    batch_size = max(1, min(MAX_BATCH_FRAMES, BATCH_BYTES // frame_bytes))
+    # Compile the JIT kernel now rather than stalling on the first batch
+    if not watermark["is_blank"]:
+        _warm_up_blend_jit()
+    # Working buffer reused by every batch's blend
+    blend_scratch = np.empty(
+        (batch_size, *watermark["alpha_q8"].shape), np.uint16)
 
     console.print("\nProcessing video...")
-    frame_count = 0
+    # The blend loop only bumps this counter; a reporter thread samples it
+    progress = {"frames": 0}
+    stop_reporting = _start_progress_reporter(progress, total_frames)
+
+    # Decode and encode on their own threads so they overlap with the blend;
+    # OpenCV releases the GIL while reading, writing and doing array math
+    queue_size = max(1, FRAME_QUEUE_SIZE // batch_size)
+    read_queue = queue.Queue(maxsize=queue_size)
+    write_queue = queue.Queue(maxsize=queue_size)
+    # Enough preallocated batches to fill both queues plus one per stage
+    free_buffers = queue.Queue()
+    for _ in range(2 * queue_size + 3):
+        free_buffers.put(
+            np.empty((batch_size, frame_height, frame_width, 3), np.uint8))
+    pipeline_errors = []
+    reader = threading.Thread(
+        target=_read_frames,
+        args=(cap, free_buffers, read_queue, pipeline_errors),
+        daemon=True,
+    )
+    writer = threading.Thread(
+        target=_write_frames,
+        args=(out, write_queue, free_buffers, pipeline_errors),
+        daemon=True,
+    )
+    reader.start()
+    writer.start()
 
     while True:
-        ret, frame = cap.read()
-        if not ret:
+        item = read_queue.get()
+        if item is None:
             break
+        batch, count = item
 
-        # Per-pixel alpha blend the overlay onto the frame in BGR space
-        frame_float = frame.astype(np.float32)
-        # Blend each color channel using the same alpha mask
-        for c in range(3):
-            frame_float[:, :, c] = (
-                frame_float[:, :, c] * (1.0 - mask) +
-                overlay_float[:, :, c] * mask
-            )
-        final_frame = np.clip(frame_float, 0, 255).astype(np.uint8)
+        # Per-pixel alpha blend inside the text's bounding box only;
+        # everything outside it passes through untouched
+        if not watermark["is_blank"]:
+            blend_watermark(batch[:count], watermark, blend_scratch)
+
+        # Hand the batch to the writer thread
+        write_queue.put(item)
 
-        # Write frame
-        out.write(final_frame)
+        progress["frames"] += count
 
-        frame_count += 1
-        if (
-            total_frames > 0 and frame_count % 30 == 0
-        ):  # Progress update every 30 frames
-            progress = (frame_count / total_frames) * 100
-            console.print(f"Progress: {progress:.1f}%")
+    write_queue.put(None)
+    writer.join()
+    reader.join()
+    stop_reporting()
 
-    # Release everything
+    # Release the capture; the writer thread has already flushed the encoder
     cap.release()
-    out.release()
 
-    audio_copied = mux_audio_into_video(
-        video_path, temp_video_path, output_path)
-    if audio_copied:
+    if pipeline_errors:
+        console.print(
+            f"[bold red]Error:[/] Failed while processing frames ({escape(str(pipeline_errors[0]))}).")
         try:
-            os.remove(temp_video_path)
+            os.remove(output_path)
         except OSError:
             pass
-    else:
-        if not os.path.exists(output_path):
-            os.replace(temp_video_path, output_path)
-        else:
+        return False
+
+    console.print(
+        f"\n[bold green]Watermarked video saved as:[/] {output_path}")
+    return True
+
+
+def add_watermark_split_stitch(
+    video_path,
+    text_line1,
+    text_line2,
+    coverage_pct,
+    opacity_pct,
+    output_path=None,
+    max_workers=None,
+    segment_seconds=SPLIT_SEGMENT_SECONDS,
+):
+    """Watermark a long video by encoding segments of it in parallel.
+
+    The video stream is split at keyframes with ``-c copy``, each segment is
+    watermarked in its own process, and the results are joined with ffmpeg's
+    concat demuxer while the original audio is muxed back in. Falls back to
+    add_watermark_to_video when ffmpeg is missing or splitting wouldn't help.
+    """
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // 2)
+    max_workers = _parallel_encode_limit(max_workers)
+
+    cap = _open_capture(video_path, decode=False)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0
+    cap.release()
+    duration = frame_count / fps if fps > 0 else 0.0
+
+    if FFMPEG_PATH is None or max_workers < 2 or duration < 2 * segment_seconds:
+        return add_watermark_to_video(
+            video_path,
+            text_line1,
+            text_line2,
+            coverage_pct,
+            opacity_pct,
+            output_path=output_path,
+        )
+
+    if output_path is None:
+        output_path = get_unique_output_path(video_path)
+    output_dir = os.path.dirname(output_path) or "."
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Segments can be as large as the source, so keep them on the output's
+    # disk rather than in the system temp directory
+    with tempfile.TemporaryDirectory(prefix=".watermark_segments_", dir=output_dir) as temp_dir:
+        console.print(
+            f"\nSplitting video into ~{segment_seconds}s segments...")
+        split = subprocess.run(
+            [
+                FFMPEG_PATH,
+                "-nostdin",
+                "-loglevel",
+                "error",
+                "-i",
+                video_path,
+                "-map",
+                "0:v:0",
+                "-c",
+                "copy",
+                "-f",
+                "segment",
+                "-segment_time",
+                str(segment_seconds),
+                "-reset_timestamps",
+                "1",
+                # Matroska holds any source codec without remuxing issues
+                os.path.join(temp_dir, "segment_%04d.mkv"),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=SUBPROCESS_FLAGS,
+            check=False,
+        )
+        segments = sorted(
+            os.path.join(temp_dir, name)
+            for name in os.listdir(temp_dir)
+            if name.startswith("segment_")
+        )
+        if split.returncode != 0 or len(segments) < 2:
+            console.print(
+                "[bold yellow]Warning:[/] Could not split the video; processing it in one pass.")
+            return add_watermark_to_video(
+                video_path,
+                text_line1,
+                text_line2,
+                coverage_pct,
+                opacity_pct,
+                output_path=output_path,
+            )
+
+        jobs = [
+            (
+                segment,
+                os.path.join(temp_dir, f"watermarked_{i:04d}.mp4"),
+                text_line1,
+                text_line2,
+                coverage_pct,
+                opacity_pct,
+            )
+            for i, segment in enumerate(segments)
+        ]
+        max_workers = min(len(jobs), max_workers)
+        console.print(
+            f"\nWatermarking [bold]{len(jobs)}[/] segments with [bold]{max_workers}[/] worker(s)...")
+        threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+        failed = 0
+        # Workers stay quiet (per-segment video info would just be noise here)
+        # and hand back their errors and warnings instead
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(threads_per_worker, True),
+        ) as executor:
+            futures = [executor.submit(_watermark_video_job, job) for job in jobs]
+            for i, future in enumerate(as_completed(futures), 1):
+                try:
+                    success, messages = future.result()
+                except Exception as e:
+                    # e.g. a worker process died (BrokenProcessPool)
+                    success, messages = False, [f"Error: {str(e)}"]
+                for message in messages:
+                    console.print("  " + message.replace("\n", "\n  "), markup=False)
+                if not success:
+                    failed += 1
+                console.print(f"Segments done: {i}/{len(jobs)}")
+
+        if failed:
+            console.print(
+                f"[bold yellow]Warning:[/] Failed to watermark {failed} segment(s); "
+                "processing the video in a single pass instead.")
+            return add_watermark_to_video(
+                video_path,
+                text_line1,
+                text_line2,
+                coverage_pct,
+                opacity_pct,
+                output_path=output_path,
+            )
+
+        # Join the re-encoded segments without another encode and bring the
+        # original audio back from the source in the same pass
+        list_path = os.path.join(temp_dir, "segments.txt")
+        with open(list_path, "w", encoding="utf-8") as list_file:
+            for job in jobs:
+                list_file.write(f"file '{os.path.basename(job[1])}'\n")
+        audio_options = audio_codec_options(FFMPEG_PATH, video_path)
+
+        def build_command(with_audio):
+            if with_audio and audio_options:
+                audio = ["-map", "1:a?", *audio_options]
+            else:
+                audio = ["-an"]
+            return [
+                FFMPEG_PATH,
+                "-y",
+                "-nostdin",
+                "-loglevel",
+                "error",
+                "-f",
+                "concat",
+                "-i",
+                list_path,
+                "-i",
+                video_path,
+                "-map",
+                "0:v:0",
+                *audio,
+                "-c:v",
+                "copy",
+                "-movflags",
+                "+faststart",
+                output_path,
+            ]
+
+        log_path = os.path.join(temp_dir, "concat.log")
+        returncode, error_output = _run_ffmpeg(
+            build_command(with_audio=True), log_path)
+        if returncode != 0 and audio_options and AUDIO_ERROR_PATTERN.search(error_output):
+            console.print(
+                "[bold yellow]Warning:[/] ffmpeg could not copy audio; video will be silent.")
+            console.print(f"  ffmpeg output: {escape(error_output)}")
+            returncode, error_output = _run_ffmpeg(
+                build_command(with_audio=False), log_path)
+        if returncode != 0:
+            console.print(
+                f"[bold red]Error:[/] Failed to join segments ({escape(error_output)}).")
             try:
-                os.remove(temp_video_path)
+                os.remove(output_path)
             except OSError:
                 pass
+            return False
 
     console.print(
         f"\n[bold green]Watermarked video saved as:[/] {output_path}")
@@ -579,7 +1506,7 @@ def main():
         )
 
         if processing_mode == "single":
-            success = add_watermark_to_video(
+            success = add_watermark_split_stitch(
                 target_path, line1, line2, coverage_pct, opacity_pct
             )
             if success: